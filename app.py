@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from flask import Flask, jsonify, request
 from datetime import datetime, timedelta
@@ -20,6 +21,9 @@ cache: Dict[str, Optional[Union[List[Dict], datetime]]] = {
     'last_updated': None
 }
 
+# Health check body never changes, so encode it once
+HEALTH_RESPONSE_BODY = json.dumps({"status": "healthy"})
+
 
 def catch_exceptions(func):
     @wraps(func)
@@ -67,7 +71,7 @@ def get_make_ready_data():
 @app.route('/api/health', methods=['GET'])
 def health_check():
     logger.info("GET /api/health endpoint accessed.")
-    return jsonify({"status": "healthy"}), 200
+    return app.response_class(HEALTH_RESPONSE_BODY, status=200, mimetype='application/json')
 
 
 @app.route('/api/properties/search', methods=['GET'])
@@ -95,7 +99,8 @@ def search_properties():
         last_updated=cache['last_updated']
     )
 
-    return jsonify(result.model_dump())
+    # Serialize the whole result, including nested properties and metrics, in one pydantic-core call
+    return app.response_class(result.model_dump_json(), mimetype='application/json')
 
 
 @app.route('/api/reports/generate', methods=['POST'])
@@ -160,18 +165,18 @@ def generate_report():
         # Get list of generated files
         files = [f.name for f in output_path.glob('*.xlsx')]
 
-        # Create response using corrected model
-        response = ReportGenerationResponse(
+        # Every field is produced by this handler, so build the response without re-validating it
+        response = ReportGenerationResponse.model_construct(
             success=True,
             message="Reports generated successfully",
-            output=ReportOutput(
+            output=ReportOutput.model_construct(
                 directory=output_dir,
                 propertyCount=len(properties),
                 files=files
             )
         )
 
-        return jsonify(response.model_dump())
+        return jsonify(response.to_json_dict())
 
     except Exception as e:
         logger.error(f"Error generating report: {str(e)}", exc_info=True)
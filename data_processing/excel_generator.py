@@ -6,12 +6,12 @@ import openpyxl
 from click import wrap_text
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.worksheet.worksheet import Worksheet
-from pydantic import BaseModel, Field, ConfigDict, field_validator, validator, computed_field, model_validator
+from pydantic import BaseModel, Field, ConfigDict
 from what_if_table import update_what_if_table, WhatIfTableGenerator
 
 from logger_config import LogConfig, log_exceptions
 from utils.path_resolver import PathResolver
-from models.models import Property
+from models.models import Property, WorkOrderMetrics, parse_flex_date
 
 # Initialize logging
 log_config = LogConfig()
@@ -36,68 +36,6 @@ class SpreadsheetTemplate(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
 
 
-class WorkOrderMetrics(BaseModel):
-    """Model for work order metrics with calculations"""
-    # Work order tracking fields
-    open_work_orders: int = Field(ge=0)
-    new_work_orders: int = Field(ge=0)
-    completed_work_orders: int = Field(ge=0)
-    cancelled_work_orders: int = Field(ge=0)
-    pending_work_orders: int = Field(ge=0)
-    percentage_completed: float = Field(ge=0, le=100)
-
-    # Rate calculations
-    days_per_month: int = Field(ge=0, le=31, default=21)
-    daily_rate: float = Field(ge=0)
-    monthly_rate: float = Field(ge=0)
-    break_even_target: float = Field(ge=0)
-    current_output: float = Field(ge=0)
-
-    @model_validator(mode='after')
-    def calculate_rates(self) -> 'WorkOrderMetrics':
-        """Calculate all rates based on completed work orders"""
-        # Calculate daily rate from completed work orders
-        self.daily_rate = round(self.completed_work_orders / self.days_per_month, 1)
-
-        # Calculate monthly rate from daily rate
-        self.monthly_rate = round(self.daily_rate * self.days_per_month, 1)
-
-        # Set current output same as daily rate for consistency
-        self.current_output = self.daily_rate
-
-        # Calculate break-even target
-        target_rate = max(self.new_work_orders, self.completed_work_orders) / self.days_per_month
-        self.break_even_target = round(target_rate * 1.1, 1)  # Adding 10% buffer
-
-        return self
-
-    @field_validator('percentage_completed', 'daily_rate', 'monthly_rate', 'break_even_target', 'current_output')
-    def round_values(cls, v: float) -> float:
-        return round(v, 1)
-
-    def get_metrics_for_table(self) -> dict:
-        """Get metrics formatted for what-if table calculations"""
-        return {
-            'daily_rate': self.daily_rate,
-            'monthly_rate': self.monthly_rate,
-            'break_even_target': self.break_even_target,
-            'current_output': self.current_output,
-            'days_per_month': self.days_per_month
-        }
-
-    def get_all_metrics(self) -> dict:
-        """Get all metrics including work orders and calculations"""
-        return {
-            **self.get_metrics_for_table(),
-            'open_work_orders': self.open_work_orders,
-            'new_work_orders': self.new_work_orders,
-            'completed_work_orders': self.completed_work_orders,
-            'cancelled_work_orders': self.cancelled_work_orders,
-            'pending_work_orders': self.pending_work_orders,
-            'percentage_completed': self.percentage_completed
-        }
-
-
 class ExcelGeneratorService:
     """Service for handling Excel generation with improved error handling and logging"""
 
@@ -163,20 +101,12 @@ class ExcelGeneratorService:
         """Parse date from various formats with detailed error logging"""
         logger.debug(f"Parsing date value: {date_value} of type {type(date_value)}")
 
-        if isinstance(date_value, datetime):
-            return date_value
-
         try:
-            # Try parsing standard API format
-            return datetime.strptime(date_value, '%a, %d %b %Y %H:%M:%S GMT')
+            # Same GMT/ISO parsing the Property model applies to latest_post_date
+            return parse_flex_date(date_value)
         except ValueError:
-            logger.debug("Failed to parse GMT format, trying ISO format")
-            try:
-                # Try ISO format
-                return datetime.fromisoformat(date_value.replace('Z', '+00:00'))
-            except ValueError:
-                logger.error(f"Unsupported date format: {date_value}")
-                return datetime.now()
+            logger.error(f"Unsupported date format: {date_value}")
+            return datetime.now()
 
     @log_exceptions(logger)
     def update_metrics(self, metrics: WorkOrderMetrics) -> None:
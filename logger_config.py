@@ -3,10 +3,22 @@ import logging.handlers
 from pathlib import Path
 from datetime import datetime
 import os
-import sys
+import atexit
+import copy
+import queue
+import linecache
 import traceback
-from typing import Optional, Dict, Any
-from functools import wraps
+from typing import Optional, Dict, Any, Union
+from functools import wraps, lru_cache
+
+
+@lru_cache(maxsize=512)
+def _relative_path(filename: str) -> Union[Path, str]:
+    """Make a source path relative to the working directory when possible"""
+    try:
+        return Path(filename).relative_to(Path.cwd())
+    except ValueError:
+        return filename
 
 
 class ContextFormatter(logging.Formatter):
@@ -30,10 +42,7 @@ class ContextFormatter(logging.Formatter):
                 frames = []
                 for filename, line_num, func_name, code_line in tb_lines:
                     # Make the path relative to make it more readable
-                    try:
-                        rel_path = Path(filename).relative_to(Path.cwd())
-                    except ValueError:
-                        rel_path = filename
+                    rel_path = _relative_path(filename)
 
                     frames.append(f"\n    File '{rel_path}', line {line_num}, in {func_name}")
                     if code_line:
@@ -45,35 +54,66 @@ class ContextFormatter(logging.Formatter):
                 message = f"{message}\nTraceback (most recent call last):{traceback_text}\n{exc_type.__name__}: {exc_msg}"
 
             else:
-                # For errors without exceptions, add the code location
-                frame = sys._getframe()
-                while frame:
-                    if frame.f_code.co_filename != __file__:
-                        break
-                    frame = frame.f_back
-
-                if frame:
-                    filename = frame.f_code.co_filename
-                    try:
-                        rel_path = Path(filename).relative_to(Path.cwd())
-                    except ValueError:
-                        rel_path = filename
-
-                    line_num = frame.f_lineno
-                    func_name = frame.f_code.co_name
-
-                    # Try to get the actual line of code
-                    try:
-                        with open(filename, 'r') as f:
-                            lines = f.readlines()
-                            code_line = lines[line_num - 1].strip()
-                            message = f"{message}\nLocation: File '{rel_path}', line {line_num}, in {func_name}\n    {code_line}"
-                    except:
-                        message = f"{message}\nLocation: File '{rel_path}', line {line_num}, in {func_name}"
+                # For errors without exceptions, add the code location recorded on the LogRecord
+                filename, line_num, func_name = record.pathname, record.lineno, record.funcName
+                rel_path = _relative_path(filename)
+
+                # Try to get the actual line of code (linecache keeps file contents between calls)
+                code_line = linecache.getline(filename, line_num).strip()
+                if code_line:
+                    message = f"{message}\nLocation: File '{rel_path}', line {line_num}, in {func_name}\n    {code_line}"
+                else:
+                    message = f"{message}\nLocation: File '{rel_path}', line {line_num}, in {func_name}"
 
         return message
 
 
+# One queue and one listener thread shared by every handler LogConfig sets up
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for one target handler; keeps exc_info on the record so ContextFormatter can still use it"""
+
+    def __init__(self, target: logging.Handler):
+        super().__init__(_log_queue)
+        self.target = target
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Each target formats its own copy, since Formatter.format writes
+        # message/asctime/exc_text onto the record and records reach several handlers.
+        # Merge args now so later mutation of them can't change the message.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record._queue_target = self.target
+        return record
+
+
+class _TargetQueueListener(logging.handlers.QueueListener):
+    """Listener that passes each record to the handler it was queued for"""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        target = record.__dict__.pop('_queue_target')
+        if record.levelno >= target.level:
+            target.handle(record)
+
+
+# Formatting and file I/O for all loggers run on this thread; pending records are flushed on exit
+_listener = _TargetQueueListener(_log_queue)
+_listener.start()
+
+
+def _stop_listener() -> None:
+    """Stop the listener thread, flushing any pending records"""
+    # QueueListener.stop fails if the listener was already stopped
+    if _listener._thread is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
+
 class LogConfig:
     """Centralized logging configuration with enhanced error tracking"""
 
@@ -95,6 +135,10 @@ class LogConfig:
         root_logger = logging.getLogger()
         root_logger.setLevel(self.default_level)
 
+        # Every module creates a LogConfig at import; only the first one installs the console handler
+        if any(isinstance(handler, _ContextQueueHandler) for handler in root_logger.handlers):
+            return
+
         # Remove any existing handlers
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
@@ -106,7 +150,7 @@ class LogConfig:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         ))
-        root_logger.addHandler(console_handler)
+        root_logger.addHandler(_ContextQueueHandler(console_handler))
 
     def get_logger(self,
                    name: str,
@@ -146,7 +190,7 @@ class LogConfig:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         ))
-        logger.addHandler(file_handler)
+        logger.addHandler(_ContextQueueHandler(file_handler))
 
         return logger
 
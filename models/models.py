@@ -1,9 +1,89 @@
-from pydantic import BaseModel, Field, ConfigDict, field_validator, validator, model_validator
-from datetime import datetime
-from typing import Optional, List, Dict
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict, BeforeValidator, PlainSerializer, computed_field, field_validator, validator
+from datetime import datetime, date, timezone
+from email.utils import format_datetime
+from typing import Annotated, Any, Optional, List, Dict
+import math
+import re
 from enum import Enum
 
 
+def _round1(value: float) -> float:
+    """Round half away from zero to one decimal place with integer math"""
+    if not math.isfinite(value):
+        # int() can't take inf or nan; round(x, 1) returned them unchanged
+        return value
+    return int(value * 10 + (0.5 if value >= 0 else -0.5)) / 10
+
+
+# Exact GMT format used by the API, e.g. 'Wed, 23 Oct 2024 00:00:00 GMT' (case-insensitive, like strptime)
+_GMT_FAST_RE = re.compile(
+    r'(?:mon|tue|wed|thu|fri|sat|sun), (\d{2}) ([a-z]{3}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) gmt',
+    re.IGNORECASE
+)
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+
+def _parse_date_string(value: str) -> datetime:
+    """Parse a GMT, ISO or date-only string, accepting exactly what the strptime/fromisoformat chain does"""
+    # The GMT format starts with a weekday name, so only strings starting with a letter can match it
+    if value[:1].isalpha():
+        # Build the datetime directly from the fields; strptime is much slower for this fixed layout
+        match = _GMT_FAST_RE.fullmatch(value)
+        if match:
+            day, month_name, year, hour, minute, second = match.groups()
+            month = _MONTHS.get(month_name.lower())
+            if month is not None:
+                return datetime(int(year), month, int(day), int(hour), int(minute), int(second))
+        try:
+            # Full weekday/month names, unpadded fields and other forms strptime also accepts
+            return datetime.strptime(value, '%a, %d %b %Y %H:%M:%S GMT')
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        # Date-only format, including unpadded months/days
+        return datetime.strptime(value, '%Y-%m-%d')
+
+
+def parse_flex_date(value: Any) -> Any:
+    """
+    Parse the date formats we receive (GMT, ISO, date-only strings and date objects) into datetime.
+
+    Values of any other type are returned unchanged for pydantic to validate.
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    if isinstance(value, str):
+        return _parse_date_string(value)
+    return value
+
+
+def format_http_date(value: datetime) -> str:
+    """
+    Format a datetime the way Flask's JSON provider does, e.g. 'Wed, 23 Oct 2024 00:00:00 GMT'.
+
+    Naive datetimes are treated as UTC, matching werkzeug's http_date.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    else:
+        value = value.astimezone(timezone.utc)
+    return format_datetime(value, usegmt=True)
+
+
+# Datetime that serializes to JSON in the HTTP-date format API clients already receive from jsonify
+HttpDate = Annotated[datetime, PlainSerializer(format_http_date, return_type=str, when_used='json')]
+
+# HttpDate that also accepts the API's GMT and date-only formats
+FlexDate = Annotated[HttpDate, BeforeValidator(parse_flex_date)]
+
+
 class PropertyStatus(str, Enum):
     ACTIVE = "ACTIVE"
     INACTIVE = "INACTIVE"
@@ -21,50 +101,60 @@ class BaseResponse(BaseModel):
 
 class WorkOrderMetrics(BaseModel):
     """Model for work order metrics with calculations"""
-    # Work order tracking fields
-    open_work_orders: int = Field(ge=0)
-    new_work_orders: int = Field(ge=0)
-    completed_work_orders: int = Field(ge=0)
-    cancelled_work_orders: int = Field(ge=0)
-    pending_work_orders: int = Field(ge=0)
-    percentage_completed: float = Field(ge=0, le=100)
-
-    # Rate calculations with defaults (will be recalculated)
+    # Work order tracking fields (also accepted under their SQL column names)
+    open_work_orders: int = Field(ge=0, validation_alias=AliasChoices('open_work_orders', 'OpenWorkOrder_Current'))
+    new_work_orders: int = Field(ge=0, validation_alias=AliasChoices('new_work_orders', 'NewWorkOrders_Current'))
+    completed_work_orders: int = Field(
+        ge=0, validation_alias=AliasChoices('completed_work_orders', 'CompletedWorkOrder_Current'))
+    cancelled_work_orders: int = Field(
+        ge=0, validation_alias=AliasChoices('cancelled_work_orders', 'CancelledWorkOrder_Current'))
+    pending_work_orders: int = Field(ge=0, validation_alias=AliasChoices('pending_work_orders', 'PendingWorkOrders'))
+    percentage_completed: float = Field(
+        ge=0, le=100, validation_alias=AliasChoices('percentage_completed', 'PercentageCompletedThisPeriod'))
     days_per_month: int = Field(ge=0, le=31, default=21)
-    daily_rate: float = Field(ge=0, default=0.0)
-    monthly_rate: float = Field(ge=0, default=0.0)
-    break_even_target: float = Field(ge=0, default=0.0)
-    current_output: float = Field(ge=0, default=0.0)
-
-    @model_validator(mode='after')
-    def calculate_rates(self) -> 'WorkOrderMetrics':
-        """Calculate all rates based on completed work orders"""
-        try:
-            if self.days_per_month > 0:
-                # Calculate daily rate from completed work orders
-                self.daily_rate = round(self.completed_work_orders / self.days_per_month, 1)
 
-                # Calculate monthly rate from daily rate
-                self.monthly_rate = round(self.daily_rate * self.days_per_month, 1)
+    # Rates are derived from the work order counts on access and included in dumps
+    @computed_field
+    @property
+    def daily_rate(self) -> float:
+        """Daily rate from completed work orders"""
+        if self.days_per_month <= 0:
+            return 0.0
+        return _round1(self.completed_work_orders / self.days_per_month)
+
+    @computed_field
+    @property
+    def monthly_rate(self) -> float:
+        """Monthly rate from the daily rate"""
+        if self.days_per_month <= 0:
+            return 0.0
+        return _round1(self.daily_rate * self.days_per_month)
+
+    @computed_field
+    @property
+    def break_even_target(self) -> float:
+        """Break-even target with a 10% buffer over new or completed work orders"""
+        if self.days_per_month <= 0:
+            return 0.0
+        target_work_orders = max(self.new_work_orders, self.completed_work_orders)
+        return _round1(target_work_orders / self.days_per_month * 1.1)
+
+    @computed_field
+    @property
+    def current_output(self) -> float:
+        """Current output, same as the daily rate for consistency"""
+        return self.daily_rate
 
-                # Set current output same as daily rate for consistency
-                self.current_output = self.daily_rate
-
-                # Calculate break-even target
-                target_rate = max(self.new_work_orders, self.completed_work_orders) / self.days_per_month
-                self.break_even_target = round(target_rate * 1.1, 1)  # Adding 10% buffer
-        except Exception as e:
-            # If any calculation fails, ensure we have valid defaults
-            self.daily_rate = 0.0
-            self.monthly_rate = 0.0
-            self.current_output = 0.0
-            self.break_even_target = 0.0
-
-        return self
+    @classmethod
+    def from_row(cls, row: Dict, days_per_month: int = 21) -> 'WorkOrderMetrics':
+        """Build metrics from a SQL row, validating it like any other input"""
+        # The field aliases map the SQL column names; other columns in the row are ignored.
+        # NULL counts arrive from pandas as NaN, so the row must not skip validation.
+        return cls.model_validate({**row, 'days_per_month': days_per_month})
 
-    @validator('percentage_completed', 'daily_rate', 'monthly_rate', 'break_even_target', 'current_output')
+    @validator('percentage_completed')
     def round_values(cls, v: float) -> float:
-        return round(v, 1)
+        return _round1(v)
 
     def get_metrics_for_table(self) -> dict:
         """Get metrics formatted for what-if table calculations"""
@@ -94,11 +184,11 @@ class Property(BaseModel):
     property_key: int = Field(gt=0)
     property_name: str
     total_unit_count: int = Field(gt=0)
-    latest_post_date: datetime
+    latest_post_date: FlexDate
     status: PropertyStatus = PropertyStatus.ACTIVE
     metrics: Optional[WorkOrderMetrics] = None
 
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(frozen=True)
 
     @field_validator('property_name')
     @classmethod
@@ -115,7 +205,7 @@ class PropertySearchResult(BaseModel):
     """Model for property search results"""
     count: int
     data: List[Property]
-    last_updated: datetime
+    last_updated: HttpDate
 
     model_config = ConfigDict(frozen=True)
 
@@ -133,17 +223,28 @@ class ReportOutput(BaseModel):
     propertyCount: int
     files: Optional[List[str]] = None
 
+    model_config = ConfigDict(frozen=True)
+
+    def to_json_dict(self) -> dict:
+        """JSON-ready dict built from the flat field values, skipping model_dump"""
+        return dict(self.__dict__)
+
 
 class ReportGenerationResponse(BaseModel):
     """Model for report generation responses"""
     success: bool
     message: str
     output: ReportOutput
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: HttpDate = Field(default_factory=datetime.now)
+
+    model_config = ConfigDict(frozen=True)
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
+    def to_json_dict(self) -> dict:
+        """JSON-ready dict matching model_dump(mode='json'), with the nested output handled directly"""
+        return {
+            **self.__dict__,
+            'output': self.output.to_json_dict(),
+            'timestamp': format_http_date(self.timestamp)
         }
 
 
@@ -155,18 +256,17 @@ class WorkOrderAnalytics(BaseModel):
     current_output: float = Field(ge=0)
     days_per_month: int = Field(ge=0, le=31, default=21)
 
-    model_config = ConfigDict(validate_assignment=True)
-
     @field_validator('daily_rate', 'monthly_rate', 'break_even_target', 'current_output')
     @classmethod
     def round_rate(cls, v: float) -> float:
-        return round(v, 1)
+        # Runs after pydantic's float coercion, so strings and Decimals are rounded too
+        return _round1(v)
 
     def calculate_monthly_metrics(self) -> Dict[str, float]:
         """Calculate monthly metrics based on daily rates"""
         return {
-            'projected_monthly': round(self.daily_rate * self.days_per_month, 1),
-            'break_even_gap': round(self.break_even_target - self.daily_rate, 1),
-            'performance_ratio': round((self.daily_rate / self.break_even_target * 100), 1)
+            'projected_monthly': _round1(self.daily_rate * self.days_per_month),
+            'break_even_gap': _round1(self.break_even_target - self.daily_rate),
+            'performance_ratio': _round1(self.daily_rate / self.break_even_target * 100)
             if self.break_even_target > 0 else 0
         }
@@ -1,5 +1,5 @@
-from typing import List, Optional, Dict, Union
-from datetime import datetime, date
+from typing import List, Optional, Dict
+from datetime import datetime
 from logger_config import LogConfig
 from models.models import (Property,
                            WorkOrderMetrics,
@@ -15,55 +15,19 @@ class PropertySearch:
     def __init__(self, cache_data: List[Dict]):
         self.properties = self._convert_to_models(cache_data)
 
-    def _parse_date(self, date_value: Union[str, datetime, date]) -> datetime:
-        """
-        Parse different date formats into datetime object.
-
-        Args:
-            date_value: Can be string, datetime, or date object
-
-        Returns:
-            datetime object
-        """
-        if isinstance(date_value, datetime):
-            return date_value
-        elif isinstance(date_value, date):
-            return datetime.combine(date_value, datetime.min.time())
-        elif isinstance(date_value, str):
-            try:
-                # Try parsing GMT format
-                return datetime.strptime(date_value, '%a, %d %b %Y %H:%M:%S GMT')
-            except ValueError:
-                try:
-                    # Try parsing ISO format
-                    return datetime.fromisoformat(date_value.replace('Z', '+00:00'))
-                except ValueError:
-                    # Try parsing date-only format
-                    return datetime.strptime(date_value, '%Y-%m-%d')
-
     def _convert_to_models(self, cache_data: List[Dict]) -> List[Property]:
         """Convert raw cache data to Property models with computed metrics"""
         properties = []
         for data in cache_data:
             try:
-                # Create metrics with work order data - rates will be auto-calculated
-                metrics = WorkOrderMetrics(
-                    open_work_orders=data['OpenWorkOrder_Current'],
-                    new_work_orders=data['NewWorkOrders_Current'],
-                    completed_work_orders=data['CompletedWorkOrder_Current'],
-                    cancelled_work_orders=data['CancelledWorkOrder_Current'],
-                    pending_work_orders=data['PendingWorkOrders'],
-                    percentage_completed=data['PercentageCompletedThisPeriod'],
-                    days_per_month=21  # Default value
-                )
-
-                latest_post_date = self._parse_date(data['LatestPostDate'])
+                # Map and validate the SQL columns; a bad row is logged and skipped below
+                metrics = WorkOrderMetrics.from_row(data)
 
                 property = Property(
                     property_key=data['PropertyKey'],
                     property_name=data['PropertyName'],
                     total_unit_count=data['TotalUnitCount'],
-                    latest_post_date=latest_post_date,
+                    latest_post_date=data['LatestPostDate'],
                     status=PropertyStatus.ACTIVE,
                     metrics=metrics
                 )
@@ -99,7 +63,8 @@ class PropertySearch:
                           last_updated: Optional[datetime] = None) -> PropertySearchResult:
         """Get formatted search result with metadata"""
         properties = self.search_properties(search_term, property_keys)
-        return PropertySearchResult(
+        # Properties were validated in _convert_to_models, so skip re-validating the list
+        return PropertySearchResult.model_construct(
             count=len(properties),
             data=properties,
             last_updated=last_updated or datetime.now()
@@ -16,6 +16,8 @@ class APITester:
 
     def __init__(self, base_url: str = "http://127.0.0.1:5000"):
         self.base_url = base_url
+        # Reuse one pooled session so keep-alive connections are shared across calls
+        self.session = requests.Session()
         logger.info(f"Initialized APITester with base URL: {base_url}")
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
@@ -24,7 +26,7 @@ class APITester:
         logger.debug(f"Making {method} request to: {url}")
 
         try:
-            response = requests.request(method, url, **kwargs)
+            response = self.session.request(method, url, **kwargs)
             response.raise_for_status()  # Raise exception for bad status codes
             return response
         except requests.exceptions.RequestException as e:
@@ -90,6 +92,10 @@ class APITester:
             logger.error(f"Unexpected error in report generation: {str(e)}", exc_info=True)
             raise
 
+    def close(self) -> None:
+        """Close the underlying HTTP session"""
+        self.session.close()
+
 
 if __name__ == "__main__":
     def run_tests():
@@ -104,6 +110,8 @@ if __name__ == "__main__":
             test_search_and_generate_report(tester)
         except Exception as e:
             logger.error(f"Test suite failed: {str(e)}", exc_info=True, stack_info=True)
+        finally:
+            tester.close()
 
 
     def test_get_all_properties(tester):
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from decimal import Decimal
 import pytest
 from pydantic import ValidationError
 from models.models import (
@@ -6,6 +7,8 @@ from models.models import (
     Property,
     PropertyStatus,
     ReportGenerationRequest,
+    ReportGenerationResponse,
+    ReportOutput,
     WorkOrderAnalytics
 )
 
@@ -45,6 +48,40 @@ class TestWorkOrderMetrics:
                 percentage_completed=101
             )
 
+    def test_from_row_matches_validated_metrics(self):
+        row = {
+            'OpenWorkOrder_Current': 10,
+            'NewWorkOrders_Current': 25,
+            'CompletedWorkOrder_Current': 30,
+            'CancelledWorkOrder_Current': 1,
+            'PendingWorkOrders': 11,
+            'PercentageCompletedThisPeriod': 75.67
+        }
+        metrics = WorkOrderMetrics.from_row(row)
+        validated = WorkOrderMetrics(
+            open_work_orders=10,
+            new_work_orders=25,
+            completed_work_orders=30,
+            cancelled_work_orders=1,
+            pending_work_orders=11,
+            percentage_completed=75.67
+        )
+        assert metrics.get_all_metrics() == validated.get_all_metrics()
+        assert WorkOrderMetrics.model_validate(row).get_all_metrics() == validated.get_all_metrics()
+
+    def test_from_row_rejects_null_counts(self):
+        # pandas turns NULL counts into NaN when the cache is built
+        row = {
+            'OpenWorkOrder_Current': 10,
+            'NewWorkOrders_Current': 25,
+            'CompletedWorkOrder_Current': float('nan'),
+            'CancelledWorkOrder_Current': 1,
+            'PendingWorkOrders': 11,
+            'PercentageCompletedThisPeriod': 75.67
+        }
+        with pytest.raises(ValidationError):
+            WorkOrderMetrics.from_row(row)
+
 
 class TestProperty:
     @pytest.fixture
@@ -71,6 +108,44 @@ class TestProperty:
         assert property.property_name == "Test Property"
         assert property.status == PropertyStatus.ACTIVE
 
+    def test_property_is_frozen(self, valid_metrics):
+        property = Property(
+            property_key=1,
+            property_name="Test Property",
+            total_unit_count=100,
+            latest_post_date=datetime.now(),
+            metrics=valid_metrics
+        )
+        with pytest.raises(ValidationError):
+            property.property_name = "Renamed Property"
+
+    def test_latest_post_date_formats(self):
+        for value in ['Wed, 23 Oct 2024 00:00:00 GMT', '2024-10-23T00:00:00', '2024-10-23']:
+            property = Property(
+                property_key=1,
+                property_name="Test Property",
+                total_unit_count=100,
+                latest_post_date=value
+            )
+            assert property.latest_post_date == datetime(2024, 10, 23)
+
+        with pytest.raises(ValidationError):
+            Property(
+                property_key=1,
+                property_name="Test Property",
+                total_unit_count=100,
+                latest_post_date='Invalid Date Format'
+            )
+
+    def test_property_name_is_stripped(self):
+        property = Property(
+            property_key=1,
+            property_name="  Test Property \n",
+            total_unit_count=100,
+            latest_post_date=datetime.now()
+        )
+        assert property.property_name == "Test Property"
+
     def test_property_name_validation(self):
         with pytest.raises(ValueError):
             Property(
@@ -80,6 +155,14 @@ class TestProperty:
                 latest_post_date=datetime.now()
             )
 
+        with pytest.raises(ValueError):
+            Property(
+                property_key=1,
+                property_name="   ",
+                total_unit_count=100,
+                latest_post_date=datetime.now()
+            )
+
         with pytest.raises(ValueError):
             Property(
                 property_key=1,
@@ -102,6 +185,16 @@ class TestWorkOrderAnalytics:
         assert analytics.break_even_target == 15.1
         assert analytics.current_output == 12.9
 
+    def test_coerced_rates_are_rounded(self):
+        analytics = WorkOrderAnalytics(
+            daily_rate='10.04',
+            monthly_rate=Decimal('200.06'),
+            break_even_target=15.123,
+            current_output=12.89
+        )
+        assert analytics.daily_rate == 10.0
+        assert analytics.monthly_rate == 200.1
+
     def test_monthly_metrics_calculation(self):
         analytics = WorkOrderAnalytics(
             daily_rate=10.0,
@@ -115,6 +208,32 @@ class TestWorkOrderAnalytics:
         assert metrics['break_even_gap'] == 5.0
         assert metrics['performance_ratio'] == 66.7
 
+    def test_monthly_metrics_follow_field_updates(self):
+        analytics = WorkOrderAnalytics(
+            daily_rate=10.0,
+            monthly_rate=200.0,
+            break_even_target=15.0,
+            current_output=12.0
+        )
+        first = analytics.calculate_monthly_metrics()
+        first['projected_monthly'] = 0
+        assert analytics.calculate_monthly_metrics()['projected_monthly'] == 210.0
+
+        analytics.daily_rate = 12.0
+        assert analytics.calculate_monthly_metrics()['projected_monthly'] == 252.0
+
+    def test_infinite_daily_rate(self):
+        analytics = WorkOrderAnalytics(
+            daily_rate=float('inf'),
+            monthly_rate=1.0,
+            break_even_target=2.0,
+            current_output=1.0
+        )
+        metrics = analytics.calculate_monthly_metrics()
+        assert metrics['projected_monthly'] == float('inf')
+        assert metrics['break_even_gap'] == float('-inf')
+        assert metrics['performance_ratio'] == float('inf')
+
     def test_zero_break_even_target(self):
         analytics = WorkOrderAnalytics(
             daily_rate=10.0,
@@ -236,3 +355,22 @@ class TestReportGenerationRequest:
 
         with pytest.raises(ValidationError):
             ReportGenerationRequest(properties=[1.1, 2.2, 3.3])  # Floats instead of ints
+
+
+class TestReportGenerationResponse:
+    def test_to_json_dict_matches_model_dump(self):
+        response = ReportGenerationResponse(
+            success=True,
+            message="Reports generated successfully",
+            output=ReportOutput(directory="output/report", propertyCount=2, files=["a.xlsx", "b.xlsx"])
+        )
+        assert response.to_json_dict() == response.model_dump(mode='json')
+
+    def test_timestamp_uses_http_date(self):
+        response = ReportGenerationResponse(
+            success=True,
+            message="Reports generated successfully",
+            output=ReportOutput(directory="output/report", propertyCount=1),
+            timestamp=datetime(2024, 10, 23, 12, 0, 0, 123456)
+        )
+        assert response.to_json_dict()['timestamp'] == 'Wed, 23 Oct 2024 12:00:00 GMT'
@@ -1,5 +1,7 @@
+import json
 import pytest
 from datetime import datetime, date
+from models.models import parse_flex_date
 from property_search import PropertySearch
 
 
@@ -86,3 +88,108 @@ def test_property_search_invalid_date():
 
     # Verify that the invalid property was skipped
     assert len(searcher.properties) == 0
+
+
+def test_property_search_date_format_switch():
+    """Test that rows still parse when the date format changes mid-batch"""
+    base = {
+        'TotalUnitCount': 100,
+        'OpenWorkOrder_Current': 5,
+        'NewWorkOrders_Current': 10,
+        'CompletedWorkOrder_Current': 8,
+        'CancelledWorkOrder_Current': 2,
+        'PendingWorkOrders': 5,
+        'PercentageCompletedThisPeriod': 75.5
+    }
+    test_data = [
+        {**base, 'PropertyKey': 1, 'PropertyName': 'ISO 1', 'LatestPostDate': '2024-10-23T00:00:00'},
+        {**base, 'PropertyKey': 2, 'PropertyName': 'ISO 2', 'LatestPostDate': '2024-10-24T00:00:00'},
+        {**base, 'PropertyKey': 3, 'PropertyName': 'GMT', 'LatestPostDate': 'Fri, 25 Oct 2024 00:00:00 GMT'},
+    ]
+
+    searcher = PropertySearch(test_data)
+
+    assert [p.latest_post_date.day for p in searcher.properties] == [23, 24, 25]
+
+
+def test_property_search_skips_null_counts():
+    """Test that a row with a NULL (NaN) count is skipped and the rest still serialize"""
+    base = {
+        'TotalUnitCount': 100,
+        'LatestPostDate': 'Wed, 23 Oct 2024 00:00:00 GMT',
+        'OpenWorkOrder_Current': 5,
+        'NewWorkOrders_Current': 10,
+        'CompletedWorkOrder_Current': 8,
+        'CancelledWorkOrder_Current': 2,
+        'PendingWorkOrders': 5,
+        'PercentageCompletedThisPeriod': 75.5
+    }
+    test_data = [
+        {**base, 'PropertyKey': 1, 'PropertyName': 'Null Counts', 'CompletedWorkOrder_Current': float('nan')},
+        {**base, 'PropertyKey': 2, 'PropertyName': 'Good Row'},
+    ]
+
+    searcher = PropertySearch(test_data)
+    result = json.loads(searcher.get_search_result().model_dump_json())
+
+    assert result['count'] == 1
+    assert result['data'][0]['property_name'] == 'Good Row'
+    assert result['data'][0]['metrics']['daily_rate'] == 0.4
+
+
+def test_property_search_json_uses_http_dates():
+    """Test that search results keep the HTTP-date format Flask's jsonify produced"""
+    test_data = [{
+        'PropertyKey': 1,
+        'PropertyName': 'Test Property 1',
+        'TotalUnitCount': 100,
+        'LatestPostDate': '2024-10-23T00:00:00',
+        'OpenWorkOrder_Current': 5,
+        'NewWorkOrders_Current': 10,
+        'CompletedWorkOrder_Current': 8,
+        'CancelledWorkOrder_Current': 2,
+        'PendingWorkOrders': 5,
+        'PercentageCompletedThisPeriod': 75.5
+    }]
+
+    searcher = PropertySearch(test_data)
+    result = json.loads(searcher.get_search_result(last_updated=datetime(2024, 10, 24, 8, 30)).model_dump_json())
+
+    assert result['last_updated'] == 'Thu, 24 Oct 2024 08:30:00 GMT'
+    assert result['data'][0]['latest_post_date'] == 'Wed, 23 Oct 2024 00:00:00 GMT'
+
+
+def test_parse_flex_date_accepts_same_strings_as_strptime_chain():
+    """Test that the fast date parser accepts and rejects the same strings as the strptime/fromisoformat chain"""
+    def reference(value):
+        try:
+            return datetime.strptime(value, '%a, %d %b %Y %H:%M:%S GMT')
+        except ValueError:
+            try:
+                return datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                return datetime.strptime(value, '%Y-%m-%d')
+
+    values = [
+        'Wed, 23 Oct 2024 00:00:00 GMT',
+        'wed, 23 oct 2024 13:45:59 gmt',
+        'Wednesday, 23 October 2024 00:00:00 GMT',
+        'Wed, 3 Oct 2024 0:00:00 GMT',
+        'Xyz, 23 Oct 2024 00:00:00 GMT',
+        'Wed, 23 Foo 2024 00:00:00 GMT',
+        'Wed, 31 Feb 2024 00:00:00 GMT',
+        '2024-10-23T00:00:00Z',
+        '2024-10-23',
+        '2024-1-5',
+        '20241023',
+        'Invalid Date Format',
+        '',
+    ]
+    for value in values:
+        try:
+            expected = reference(value)
+        except ValueError:
+            with pytest.raises(ValueError):
+                parse_flex_date(value)
+        else:
+            assert parse_flex_date(value) == expected, value